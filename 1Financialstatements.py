@@ -21,8 +21,11 @@
 # If edgartools is not installed in this environment, uncomment:
 #!pip install edgartools
 
-from edgar import *
-from edgar.xbrl.xbrl import *
+# Import only what the notebook uses: the star imports pulled in the whole
+# XBRL subsystem (taxonomy parsers, lxml, rendering) at kernel startup even
+# though this script only needs Company and set_identity. XBRL objects are
+# reached lazily through filing.xbrl() when a filing is actually loaded.
+from edgar import Company, set_identity
 import pandas as pd
 
 # 👇 IMPORTANT: use your real email (SEC user-agent requirement)
@@ -36,6 +39,16 @@ pd.set_option("display.width", 120)
 # In[38]:
 
 
+import sys
+
+# Conversion method names, interned once at module scope rather than rebuilt
+# per call; keep in sync with _CONVERTERS in Rav/tickerinput.py.
+_CONV_METHODS = tuple(sys.intern(m) for m in (
+    "to_frame", "to_dataframe", "to_df", "to_pandas",
+    "as_dataframe", "as_df", "as_pandas", "get_dataframe",
+))
+
+
 def normalize_statement(stmt):
     """
     Take whatever edgartools returns for a statement
@@ -52,7 +65,7 @@ def normalize_statement(stmt):
         stmt = stmt()
 
     # Try common methods
-    for attr in ("get_dataframe", "to_pandas", "to_dataframe"):
+    for attr in _CONV_METHODS:
         if hasattr(stmt, attr):
             return getattr(stmt, attr)()
 
@@ -67,11 +80,24 @@ def normalize_statement(stmt):
 # In[39]:
 
 
+from functools import lru_cache
+
+
+@lru_cache(maxsize=512)
+def _company(cik_or_ticker: str):
+    """
+    Memoized Company lookup. Constructing a Company downloads and parses the
+    SEC submissions JSON, so re-running a cell for the same ticker should hit
+    the cache instead of the network.
+    """
+    return Company(cik_or_ticker)
+
+
 def get_latest_filing_obj(cik_or_ticker: str, form: str = "10-K"):
     """
     Returns the latest filing object (e.g. TenK / TenQ) for a given ticker/CIK.
     """
-    company = Company(cik_or_ticker)
+    company = _company(cik_or_ticker)
     filings = company.get_filings(form=form)
     latest = filings.latest(1).obj()
     return latest
@@ -82,9 +108,6 @@ def get_latest_filing_obj(cik_or_ticker: str, form: str = "10-K"):
 
 #Single, simple filing for 10-Q or 10-K
 
-from edgar import *
-from edgar.xbrl.xbrl import *
-
 # Get a company's latest 10-K filing
 #company = Company('MSFT')
 #filing = company.latest("10-Q")
@@ -100,9 +123,7 @@ elif form_type == "k":
 else:
     raise ValueError("Invalid input: must be 'q' or 'k'.")
 
-from edgar import Company
-
-company = Company('AAPL')
+company = _company('AAPL')
 filing = company.latest('k')
 
 print(f"Loaded latest {form} filing for {ticker}:")
@@ -115,15 +136,16 @@ xbrl = filing.xbrl()
 # Access statements through the user-friendly API
 statements = xbrl.statements
 
-# Display financial statements
+# Display financial statements (each call materializes the statement from
+# XBRL, so bind once and reuse)
 balance_sheet = statements.balance_sheet()
 income_statement = statements.income_statement()
 cash_flow = statements.cashflow_statement()
 
-#Convert each statement to dataframes
-balance_sheet_df = statements.balance_sheet()
-income_stmt_df = statements.income_statement()
-cash_flow_df = statements.cashflow_statement()
+# DataFrame views of the same statements — no need to re-materialize
+balance_sheet_df = normalize_statement(balance_sheet)
+income_stmt_df = normalize_statement(income_statement)
+cash_flow_df = normalize_statement(cash_flow)
 
 print(income_statement)
 print(balance_sheet)
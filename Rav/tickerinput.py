@@ -9,17 +9,45 @@ Usage (Jupyter):
 - Paste this whole cell into one notebook cell and run.
 - Follow the prompts in the notebook cell output.
 """
+import functools
+import os
+import sys
+from pathlib import Path
 from typing import Tuple, Optional, Any
 import pandas as pd
 
 # adapt import paths to your repo layout
 try:
-    from edgar import Company
+    from edgar import Company, is_using_local_storage, use_local_storage
     from edgar.xbrl.xbrl import XBRL  # not strictly required, kept for clarity
 except Exception:
     # If imports differ in your environment adjust them
     raise
 
+# Honor a pre-configured local filing store. filing.xbrl() resolves its
+# attachments through Filing.sgml(), which reads the filing from local storage
+# before falling back to SEC HTTP — so on a warm store each fetch below becomes
+# a pure disk+CPU operation instead of a network round-trip per filing.
+_local_data_dir = os.environ.get("EDGAR_LOCAL_DATA_DIR")
+if _local_data_dir and not is_using_local_storage() and Path(_local_data_dir).expanduser().is_dir():
+    use_local_storage(_local_data_dir)
+
+@functools.lru_cache(maxsize=512)
+def _company(ticker: str) -> Company:
+    """
+    Memoized Company construction. Building a Company fetches and parses the
+    SEC submissions JSON, so repeated lookups of the same ticker (notebook
+    cell re-runs, several ratio passes, fetch_many batches) should reuse it.
+    """
+    return Company(ticker)
+
+
+@functools.lru_cache(maxsize=2048)
+def _latest_filing(ticker: str, filing_type: str):
+    """Memoized latest-filing lookup, keyed on (ticker, form)."""
+    return _company(ticker).latest(filing_type)
+
+
 def _prompt_ticker() -> str:
     while True:
         t = input("Enter ticker (e.g. AAPL): ").strip().upper()
@@ -40,14 +68,47 @@ def _prompt_freq() -> str:
             return "10-Q"
         print("Invalid choice. Enter 'k' or 'q'.")
 
+# common conversion method names, probed once per class (see _resolve_converter).
+# Interned so getattr's dict probes hit on pointer identity instead of a full
+# string compare; keep this list in sync with normalize_statement in
+# 1Financialstatements.py.
+_CONVERTERS = tuple(sys.intern(m) for m in (
+    "to_frame", "to_dataframe", "to_df", "to_pandas",
+    "as_dataframe", "as_df", "as_pandas", "get_dataframe",
+))
+
+# attributes that might contain a tabular representation (slow-path fallback)
+_TABULAR_ATTRS = ("df", "data", "dataframe", "table", "rows", "items", "statements")
+
+# Last-resort pd.json_normalize(obj.__dict__) fallback. Off by default: it has
+# never been productive for edgartools Statement types, and on a statement
+# carrying nested fact arrays it materializes the whole __dict__ (O(facts)
+# time and memory) before usually raising anyway. Flip on only when poking at
+# unknown third-party objects.
+_ENABLE_JSON_NORMALIZE_FALLBACK = False
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_converter(cls: type) -> Optional[str]:
+    """
+    Find the first usable conversion method for a class, memoized per class.
+    Statement objects of the same type always convert the same way, so the
+    attribute probing only happens once per type instead of per call.
+    """
+    for meth in _CONVERTERS:
+        if callable(getattr(cls, meth, None)):
+            return meth
+    return None
+
+
 def ensure_dataframe(obj: Any, name: str = "object") -> pd.DataFrame:
     """
     Try to coerce various statement objects into a pandas DataFrame.
     Strategy:
       - if already DataFrame, return it
-      - try common conversion methods: to_frame, to_dataframe, to_df, to_pandas, as_dataframe
+      - call the conversion method resolved per class (to_frame, to_dataframe, ...)
       - if list/tuple/dict try pd.DataFrame(...)
-      - as last resort, try pd.json_normalize on __dict__
+      - optionally (off by default) try pd.json_normalize on __dict__
     Raises TypeError if conversion fails.
     """
     if isinstance(obj, pd.DataFrame):
@@ -56,23 +117,22 @@ def ensure_dataframe(obj: Any, name: str = "object") -> pd.DataFrame:
     if obj is None:
         raise TypeError(f"{name} is None")
 
-    # common conversion method names
-    for meth in ("to_frame", "to_dataframe", "to_df", "to_pandas", "as_dataframe", "as_df", "as_pandas"):
-        fn = getattr(obj, meth, None)
-        if callable(fn):
-            try:
-                res = fn()
-                if isinstance(res, pd.DataFrame):
-                    return res
-                # if returns records, attempt DataFrame conversion
-                if isinstance(res, (list, dict, tuple)):
-                    return pd.DataFrame(res)
-            except Exception:
-                # ignore and continue trying other methods
-                pass
+    # hot path: one cached lookup + one bound-method call, no attribute sweep
+    meth = _resolve_converter(type(obj))
+    if meth is not None:
+        try:
+            res = getattr(obj, meth)()
+            if isinstance(res, pd.DataFrame):
+                return res
+            # if returns records, attempt DataFrame conversion
+            if isinstance(res, (list, dict, tuple)):
+                return pd.DataFrame(res)
+        except Exception:
+            # fall through to the slower attribute-based strategies
+            pass
 
     # attributes that might contain tabular representation
-    for attr in ("df", "data", "dataframe", "table", "rows", "items", "statements"):
+    for attr in _TABULAR_ATTRS:
         if hasattr(obj, attr):
             val = getattr(obj, attr)
             if isinstance(val, pd.DataFrame):
@@ -87,13 +147,14 @@ def ensure_dataframe(obj: Any, name: str = "object") -> pd.DataFrame:
         except Exception:
             pass
 
-    # try json normalize on __dict__
-    d = getattr(obj, "__dict__", None)
-    if isinstance(d, dict) and d:
-        try:
-            return pd.json_normalize(d)
-        except Exception:
-            pass
+    # optional last resort: json normalize on __dict__ (opt-in, see above)
+    if _ENABLE_JSON_NORMALIZE_FALLBACK:
+        d = getattr(obj, "__dict__", None)
+        if isinstance(d, dict) and d:
+            try:
+                return pd.json_normalize(d)
+            except Exception:
+                pass
 
     # fallback - show helpful diagnostics to user
     raise TypeError(
@@ -107,9 +168,9 @@ def fetch_and_prepare_statements(ticker: str, filing_type: str, prefer_edgar: bo
     Fetches the latest filing of the given type for the ticker and returns DataFrames:
       (balance_sheet_df, income_stmt_df, cash_flow_df_or_None)
     """
-    # Build Company and get latest filing
-    company = Company(ticker)
-    filing = company.latest(filing_type)  # filing_type: "10-K" or "10-Q"
+    # Build Company and get latest filing (memoized across calls; normalize
+    # the key so "aapl " and "AAPL" share a cache entry)
+    filing = _latest_filing(ticker.strip().upper(), filing_type)  # filing_type: "10-K" or "10-Q"
     if filing is None:
         raise RuntimeError(f"No latest {filing_type} filing found for {ticker}")
 
@@ -135,11 +196,14 @@ def fetch_and_prepare_statements(ticker: str, filing_type: str, prefer_edgar: bo
     is_df = ensure_dataframe(is_obj, "income_statement")
     cf_df = ensure_dataframe(cf_obj, "cash_flow") if cf_obj is not None else None
 
-    # Normalize index/period handling: if 'period' column exists make it the index and cast to str
+    # Normalize index/period handling: if 'period' column exists make it the index.
+    # The index becomes a categorical of strings: the period labels are interned
+    # once here instead of re-cast per consumer, and downstream code that
+    # recognizes CategoricalIndex can skip its own astype(str) pass.
     def _normalize(df: pd.DataFrame) -> pd.DataFrame:
         if "period" in df.columns:
             df = df.set_index("period")
-        df.index = df.index.astype(str)
+        df.index = pd.CategoricalIndex(df.index.astype(str))
         return df
 
     bs_df = _normalize(bs_df)
@@ -149,6 +213,40 @@ def fetch_and_prepare_statements(ticker: str, filing_type: str, prefer_edgar: bo
 
     return bs_df, is_df, cf_df
 
+def fetch_many(tickers, filing_type: str, max_workers: int = 10) -> dict:
+    """
+    Fetch and prepare statements for several tickers concurrently.
+
+    The workload is I/O-bound (SEC HTTP requests), so a thread pool pipelines
+    the latency across tickers instead of serializing one round-trip after
+    another. SEC's ~10 requests/sec policy is enforced globally by
+    edgar.httpclient's shared rate-limited client, so the pool only needs to
+    be wide enough to keep that limit saturated — no extra throttling here.
+
+    Returns {ticker: (bs_df, is_df, cf_df_or_None)}. Tickers whose fetch
+    failed map to the raised exception instead of a tuple, so one bad ticker
+    doesn't sink the whole batch.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    tickers = [t.strip().upper() for t in tickers]
+    results: dict = {}
+    if not tickers:
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers))) as executor:
+        futures = {
+            executor.submit(fetch_and_prepare_statements, ticker, filing_type): ticker
+            for ticker in tickers
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                results[ticker] = future.result()
+            except Exception as exc:
+                results[ticker] = exc
+    return results
+
 def interactive_fetch_and_show():
     """
     Single-cell interactive flow: prompt, fetch, convert, and print brief summaries.
@@ -88,6 +88,32 @@ def get_edgar_rate_limit_per_sec():
     return int(os.environ.get("EDGAR_RATE_LIMIT_PER_SEC", "9"))
 
 
+def get_edgar_max_connections():
+    """
+    Returns the maximum size of the shared HTTP connection pool.
+    Defaults to 20 connections, enough to keep the SEC rate limit saturated
+    from a thread pool while reusing warm TLS connections across requests.
+    """
+    return int(os.environ.get("EDGAR_MAX_CONNECTIONS", "20"))
+
+
+class _PooledThrottleCache(HttpxThrottleCache):
+    """
+    HttpxThrottleCache that forwards connection-pool limits to the transport.
+
+    The base class builds its own transport chain, so a 'limits' entry in
+    httpx_params would be silently ignored by httpx.Client. Route it to the
+    underlying httpx.HTTPTransport instead, where the pool actually lives.
+    """
+
+    def _get_httpx_transport_params(self, params):
+        transport_params = super()._get_httpx_transport_params(params)
+        limits = params.pop("limits", None)
+        if limits is not None:
+            transport_params["limits"] = limits
+        return transport_params
+
+
 def get_http_mgr(cache_enabled: bool = True, request_per_sec_limit: int = 9) -> HttpxThrottleCache:
     cache_mode: Literal[False, "Disabled", "Hishel-S3", "Hishel-File", "FileCache"]
     if cache_enabled:
@@ -97,11 +123,15 @@ def get_http_mgr(cache_enabled: bool = True, request_per_sec_limit: int = 9) ->
         cache_dir = None
         cache_mode = "Disabled"
 
-    http_mgr = HttpxThrottleCache(
+    http_mgr = _PooledThrottleCache(
         user_agent_factory=get_identity, cache_dir=cache_dir, cache_mode=cache_mode, request_per_sec_limit=request_per_sec_limit,
         cache_rules = CACHE_RULES
     )
     http_mgr.httpx_params["verify"] = get_edgar_verify_ssl()
+    max_connections = get_edgar_max_connections()
+    http_mgr.httpx_params["limits"] = httpx.Limits(
+        max_connections=max_connections, max_keepalive_connections=max_connections
+    )
     return http_mgr
 
 
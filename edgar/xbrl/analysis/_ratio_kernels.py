@@ -0,0 +1,62 @@
+"""
+Inner kernels for batch ratio calculations.
+
+When FinancialRatioAnalyzer is fanned out over large panels (hundreds of
+companies x many periods), each ratio is only a handful of operations on
+small arrays, so interpreter and ufunc dispatch overhead dominates. These
+kernels compile the arithmetic with Numba when it is installed
+(``pip install edgartools[performance]``) and fall back to equivalent NumPy
+expressions otherwise, so callers can import them unconditionally.
+
+Semantics shared by both implementations: a zero denominator yields +inf
+(matching the analyzers' treatment of e.g. zero current liabilities), and
+NaN inputs propagate so periods with missing data stay NaN.
+"""
+
+import numpy as np
+
+__all__ = ["HAS_NUMBA", "safe_ratio", "safe_ratio_panel"]
+
+
+def _safe_ratio_numpy(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """numerator / denominator with zero denominators yielding +inf."""
+    # Full-width divide followed by a masked select: this lowers to one
+    # vector divide plus one blend instruction per lane group, instead of
+    # np.divide's slower where= masked-ufunc path. NaN numerators (missing
+    # periods) propagate untouched; only true zero denominators become +inf.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = numerator / denominator
+    return np.where(denominator == 0, np.inf, out)
+
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+
+    # Note: no fastmath here — it would let LLVM assume NaN-free inputs,
+    # but NaN propagation is how missing periods are represented.
+
+    @njit(cache=True)
+    def safe_ratio(numerator, denominator):  # pragma: no cover - compiled
+        out = np.empty_like(numerator)
+        for i in range(numerator.size):
+            den = denominator[i]
+            out[i] = np.inf if den == 0 else numerator[i] / den
+        return out
+
+    @njit(cache=True, parallel=True)
+    def safe_ratio_panel(numerator, denominator):  # pragma: no cover - compiled
+        """Batch variant for 2-D panels (companies x periods)."""
+        out = np.empty_like(numerator)
+        for i in prange(numerator.shape[0]):
+            for j in range(numerator.shape[1]):
+                den = denominator[i, j]
+                out[i, j] = np.inf if den == 0 else numerator[i, j] / den
+        return out
+
+except ImportError:
+    HAS_NUMBA = False
+
+    safe_ratio = _safe_ratio_numpy
+    safe_ratio_panel = _safe_ratio_numpy
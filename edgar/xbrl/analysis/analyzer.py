@@ -0,0 +1,232 @@
+"""
+Lightweight financial ratio analyzer for pre-extracted statement DataFrames.
+
+This module implements the ``FinancialRatioAnalyzer`` described in DESIGN.md:
+a small analyzer that takes balance sheet / income statement / cash flow
+DataFrames (one row per period) plus a list of reporting periods and computes
+ratios across all periods at once. Unlike
+:class:`~edgar.xbrl.analysis.ratios.FinancialRatios`, which works directly
+from an XBRL instance, this class operates on plain DataFrames so it can be
+fanned out cheaply over large panels of filings.
+
+Ratio math is vectorized: each ratio is one NumPy divide over whole column
+arrays rather than per-period label lookups, which is what matters when the
+analyzer is applied to thousands of filings.
+"""
+
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from edgar.xbrl.analysis._ratio_kernels import safe_ratio
+
+
+class RatioResult(NamedTuple):
+    """A single ratio value for one reporting period."""
+    name: str
+    period: str
+    result: float
+
+
+class FinancialRatioAnalyzer:
+    """
+    Calculate financial ratios from statement DataFrames across multiple periods.
+
+    The input DataFrames are expected to have one row per reporting period,
+    either indexed by period or carrying a 'period' column, with standardized
+    column names such as 'current_assets', 'current_liabilities',
+    'total_assets' and 'net_income'.
+    """
+
+    # The columns each statement contributes to the implemented ratios.
+    # XBRL-derived frames can be hundreds of columns wide; narrowing to these
+    # avoids copying value buffers the analyzer never reads.
+    BS_COLUMNS = ("current_assets", "current_liabilities", "total_assets")
+    IS_COLUMNS = ("net_income",)
+
+    def __init__(self,
+                 balance_sheet_df: pd.DataFrame,
+                 income_stmt_df: pd.DataFrame,
+                 cash_flow_df: Optional[pd.DataFrame] = None,
+                 periods: Optional[List[str]] = None):
+        """
+        Initialize the analyzer with statement DataFrames.
+
+        The inputs are never mutated; the analyzer works on column-narrowed
+        selections that share the underlying value buffers rather than on
+        deep copies of the inbound frames.
+
+        Args:
+            balance_sheet_df: Balance sheet data, one row per period
+            income_stmt_df: Income statement data, one row per period
+            cash_flow_df: Optional cash flow statement data, one row per period
+            periods: Reporting periods to calculate ratios for. Defaults to
+                the periods present in the balance sheet.
+        """
+        self.balance_sheet = self._normalize(self._narrow(balance_sheet_df, self.BS_COLUMNS))
+        self.income_stmt = self._normalize(self._narrow(income_stmt_df, self.IS_COLUMNS))
+        self.cash_flow = self._normalize(cash_flow_df) if cash_flow_df is not None else None
+
+        # Precompute string-index sets once: Index.astype(str) allocates a
+        # brand-new Index per call, so membership checks against it would be
+        # O(N) allocations per period
+        self._bs_idx = frozenset(map(str, self.balance_sheet.index))
+        self._is_idx = frozenset(map(str, self.income_stmt.index))
+
+        if periods is None:
+            periods = list(self.balance_sheet.index)
+        # Keep only periods that appear in at least one statement
+        self.periods = [
+            period for period in map(str, periods)
+            if period in self._bs_idx or period in self._is_idx
+        ]
+
+        # Align all statements on the requested periods once: a single concat
+        # with a statement-level column prefix, then one reindex. Every ratio
+        # below is then two MultiIndex column picks and a divide over one
+        # contiguous frame — no per-ratio (let alone per-period) index joins.
+        self._periods_idx = pd.Index(self.periods)
+        frames = {"bs": self.balance_sheet, "is": self.income_stmt}
+        if self.cash_flow is not None:
+            frames["cf"] = self.cash_flow
+        self._aligned = pd.concat(frames, axis=1).reindex(self._periods_idx)
+
+    @staticmethod
+    def _narrow(df: pd.DataFrame, columns: tuple) -> pd.DataFrame:
+        """
+        Select only the columns the ratios touch (plus 'period' for indexing).
+
+        Column selection yields a new frame over the same value buffers, so
+        this replaces a full deep copy with an O(columns-kept) operation.
+        """
+        keep = [c for c in df.columns if c in columns or c == "period"]
+        return df[keep]
+
+    @staticmethod
+    def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+        """Make 'period' the index (if present) and normalize it to strings."""
+        if "period" in df.columns:
+            df = df.set_index("period")
+        else:
+            # Shallow copy so the index assignment below can't leak back
+            # into the caller's frame; value buffers are still shared
+            df = df.copy(deep=False)
+        if not isinstance(df.index, pd.CategoricalIndex):
+            # Intern the period strings once: a categorical index compares on
+            # integer codes thereafter, and already-categorical inputs (e.g.
+            # frames normalized upstream) skip the cast entirely
+            df.index = pd.CategoricalIndex(df.index.astype(str))
+        return df
+
+    @staticmethod
+    def _as_f64(series: pd.Series) -> np.ndarray:
+        """
+        Extract a float64 ndarray from a Series, avoiding copies where possible.
+
+        NumPy-backed float64 columns come back as views on the existing
+        buffer. Extension-backed columns (Arrow / pandas nullable dtypes)
+        go through to_numpy with an explicit na_value, which hands the
+        buffer over zero-copy when the column is numeric and null-free.
+        Object columns unavoidably pay one coercion pass.
+        """
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype):
+            if dtype == np.float64:
+                return series.to_numpy(dtype=np.float64, copy=False)
+            if dtype.kind in "if":
+                return series.to_numpy(dtype=np.float64)
+            return pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, copy=False)
+        try:
+            return series.to_numpy(dtype=np.float64, na_value=np.nan, copy=False)
+        except (TypeError, ValueError):
+            return pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, copy=False)
+
+    def _column(self, statement: str, column: str) -> np.ndarray:
+        """
+        Return a float64 array for a statement column, NaN-filled if missing.
+
+        ``statement`` is the aligned frame's top-level key: 'bs', 'is' or 'cf'.
+        """
+        key = (statement, column)
+        if key not in self._aligned.columns:
+            return np.full(len(self.periods), np.nan)
+        return self._as_f64(self._aligned[key])
+
+    def _build_frame(self, name: str, ratios: np.ndarray) -> pd.DataFrame:
+        """
+        Materialize a ratio array as a columnar frame, dropping NaN periods.
+
+        Columnar results keep the ratios as one contiguous array instead of
+        a Python object per period, and frames for several ratios (or several
+        companies) can be stacked with a single ``pd.concat``.
+        """
+        mask = ~np.isnan(ratios)
+        periods = self._periods_idx
+        if not mask.all():
+            periods = self._periods_idx[mask]
+            ratios = ratios[mask]
+        return pd.DataFrame({"name": name, "period": periods, "result": ratios})
+
+    @staticmethod
+    def _frame_to_results(frame: pd.DataFrame) -> List[RatioResult]:
+        """
+        Expand a ratio frame into legacy per-period RatioResult tuples.
+
+        Built as one comprehension over pre-materialized lists, so CPython
+        sizes the result list from the iterable up front instead of growing
+        it append-by-append; the constant 'name' column is read once rather
+        than expanded into a throwaway object array.
+        """
+        if frame.empty:
+            return []
+        name = frame["name"].iloc[0]
+        return [
+            RatioResult(name, period, result)
+            for period, result in zip(frame["period"].tolist(), frame["result"].tolist())
+        ]
+
+    def calculate_current_ratio_frame(self) -> pd.DataFrame:
+        """
+        Current Ratio = Current Assets / Current Liabilities, as a DataFrame.
+
+        Returns one row per period with data, with columns 'name', 'period'
+        and 'result'. Periods where current liabilities are zero yield
+        infinity.
+        """
+        current_assets = self._column("bs", "current_assets")
+        current_liabilities = self._column("bs", "current_liabilities")
+        return self._build_frame("Current Ratio", safe_ratio(current_assets, current_liabilities))
+
+    def calculate_current_ratio(self) -> List[RatioResult]:
+        """
+        Current Ratio = Current Assets / Current Liabilities
+
+        Measures the company's ability to pay short-term obligations.
+        Periods where current liabilities are zero yield infinity.
+        Prefer :meth:`calculate_current_ratio_frame` when consuming the
+        results with pandas.
+        """
+        return self._frame_to_results(self.calculate_current_ratio_frame())
+
+    def calculate_return_on_assets_frame(self) -> pd.DataFrame:
+        """
+        Return on Assets = Net Income / Total Assets, as a DataFrame.
+
+        Returns one row per period with data, with columns 'name', 'period'
+        and 'result'. Periods where total assets are zero yield infinity.
+        """
+        net_income = self._column("is", "net_income")
+        total_assets = self._column("bs", "total_assets")
+        return self._build_frame("Return on Assets", safe_ratio(net_income, total_assets))
+
+    def calculate_return_on_assets(self) -> List[RatioResult]:
+        """
+        Return on Assets = Net Income / Total Assets
+
+        Measures how efficiently the company uses its assets to generate
+        earnings. Periods where total assets are zero yield infinity.
+        Prefer :meth:`calculate_return_on_assets_frame` when consuming the
+        results with pandas.
+        """
+        return self._frame_to_results(self.calculate_return_on_assets_frame())
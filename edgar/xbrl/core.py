@@ -4,7 +4,9 @@ Core utilities for XBRL processing.
 This module provides common functions used throughout the XBRL parser.
 """
 
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 # Constants for label roles
@@ -22,6 +24,32 @@ NAMESPACES = {
     "link": "http://www.xbrl.org/2003/linkbase"
 }
 
+# All standard namespace URI bases compiled into one anchored alternation,
+# so classifying a URI is a single automaton pass instead of a startswith
+# loop over NAMESPACES for every element in the document.
+_NAMESPACE_PREFIX_PATTERN = re.compile(
+    "|".join(f"(?P<{prefix}>{re.escape(uri)})" for prefix, uri in NAMESPACES.items())
+)
+
+
+@lru_cache(maxsize=1024)
+def prefix_for_namespace(namespace_uri: str) -> Optional[str]:
+    """
+    Map a namespace URI to its standard prefix (e.g. 'xbrli', 'link').
+
+    Matching is prefix-based so versioned URIs still classify, and results
+    are cached since instance documents reuse a small set of namespaces
+    across millions of elements.
+
+    Args:
+        namespace_uri: Full namespace URI from an element tag
+
+    Returns:
+        The standard prefix, or None if the URI is not a known namespace
+    """
+    match = _NAMESPACE_PREFIX_PATTERN.match(namespace_uri)
+    return match.lastgroup if match else None
+
 
 def parse_date(date_str: str) -> datetime.date:
     """
@@ -12,7 +12,7 @@ from typing import Any, Dict, List, Union
 from lxml import etree as ET
 
 from edgar.core import log
-from edgar.xbrl.core import NAMESPACES, classify_duration
+from edgar.xbrl.core import classify_duration, prefix_for_namespace
 from edgar.xbrl.models import Context, Fact, XBRLProcessingError
 
 from .base import BaseParser
@@ -74,18 +74,28 @@ class InstanceParser(BaseParser):
         return f"{normalized_element_id}_{context_ref}"
 
     def parse_instance(self, file_path: Union[str, Path]) -> None:
-        """Parse instance document file and extract contexts, facts, and units."""
+        """
+        Parse instance document file and extract contexts, facts, and units.
+
+        File-based parsing streams the document with iterparse (see
+        parse_instance_streaming), so peak memory is bounded by the largest
+        top-level element rather than the whole DOM.
+        """
         try:
-            content = Path(file_path).read_text()
-            self.parse_instance_content(content)
+            with open(file_path, 'rb') as fp:
+                self.parse_instance_streaming(fp)
+        except XBRLProcessingError:
+            raise
         except Exception as e:
             raise XBRLProcessingError(f"Error parsing instance file {file_path}: {str(e)}") from e
 
     def parse_instance_content(self, content: str) -> None:
         """Parse instance document content and extract contexts, facts, and units."""
         try:
-            # Use lxml's optimized parser with smart string handling and recovery mode
-            parser = ET.XMLParser(remove_blank_text=True, recover=True, huge_tree=True)
+            # Use lxml's optimized parser with smart string handling and recovery mode.
+            # collect_ids=False avoids building the xml:id hash table; fact and
+            # footnote ids are read as plain attributes, so the table is dead weight.
+            parser = ET.XMLParser(remove_blank_text=True, recover=True, huge_tree=True, collect_ids=False)
 
             # Convert to bytes for faster parsing if not already
             if isinstance(content, str):
@@ -110,6 +120,84 @@ class InstanceParser(BaseParser):
         except Exception as e:
             raise XBRLProcessingError(f"Error parsing instance content: {str(e)}") from e
 
+    def parse_instance_streaming(self, source) -> None:
+        """
+        Parse an instance document incrementally using lxml.etree.iterparse.
+
+        Top-level elements (contexts, units, facts, footnote links) are
+        consumed as their end events fire and then cleared along with their
+        already-consumed preceding siblings — the canonical lxml streaming
+        pattern. Only the element currently being processed stays resident,
+        so on large instance documents peak RSS is O(largest element) plus
+        the accumulated fact dictionaries instead of the full DOM.
+
+        Args:
+            source: Filename or binary file-like object for the instance document
+        """
+        try:
+            # Non-fact top-level elements handled elsewhere or skipped outright
+            skip_endings = ('schemaRef', 'roleRef', 'arcroleRef', 'linkbaseRef')
+
+            root = None
+            prefix_map = {}
+            facts_dict = {}
+            base_keys = {}
+            fact_count = 0
+            undefined_footnotes = set()
+
+            for event, elem in ET.iterparse(source, events=('start', 'end'),
+                                            recover=True, huge_tree=True):
+                if event == 'start':
+                    if root is None:
+                        root = elem
+                        prefix_map = self._build_prefix_map(root)
+                    continue
+
+                # Only dispatch elements sitting directly under the root;
+                # their subtrees are complete once the end event fires
+                if root is None or elem.getparent() is not root:
+                    continue
+
+                tag = elem.tag
+                if not isinstance(tag, str):
+                    # Comments and processing instructions
+                    continue
+
+                if tag.endswith('}context'):
+                    self._parse_context_element(elem)
+                elif tag.endswith('}unit'):
+                    self._parse_unit_element(elem)
+                elif tag.endswith('}footnoteLink'):
+                    try:
+                        self._parse_footnote_link(elem, undefined_footnotes, facts_dict)
+                    except Exception as e:
+                        # Footnotes are optional; match the DOM path's tolerance
+                        log.warning(f"Error extracting footnotes: {str(e)}")
+                elif not tag.endswith(skip_endings):
+                    fact_count += self._process_fact_element(elem, prefix_map, facts_dict, base_keys)
+                    for descendant in elem.iterdescendants():
+                        fact_count += self._process_fact_element(descendant, prefix_map, facts_dict, base_keys)
+
+                # Drop the consumed element and any already-consumed siblings
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del root[0]
+
+            self.facts.update(facts_dict)
+
+            if undefined_footnotes:
+                log.debug(f"{len(undefined_footnotes)} footnote arc references could not be resolved (non-critical)")
+            log.debug(f"Extracted {fact_count} facts ({len(base_keys)} unique fact identifiers)")
+
+            # Post-processing steps after all raw data is extracted
+            self._extract_entity_info()
+            self._build_reporting_periods()
+
+        except XBRLProcessingError:
+            raise
+        except Exception as e:
+            raise XBRLProcessingError(f"Error parsing instance stream: {str(e)}") from e
+
     def count_facts(self, content: str) -> tuple:
         """Count the number of facts in the instance document
         This function counts both unique facts and total fact instances in the XBRL document.
@@ -119,7 +207,7 @@ class InstanceParser(BaseParser):
         """
 
         # Use lxml's optimized parser with smart string handling and recovery mode
-        parser = ET.XMLParser(remove_blank_text=True, recover=True, huge_tree=True)
+        parser = ET.XMLParser(remove_blank_text=True, recover=True, huge_tree=True, collect_ids=False)
 
         # Convert to bytes for faster parsing if not already
         if isinstance(content, str):
@@ -162,12 +250,8 @@ class InstanceParser(BaseParser):
                 element_name = tag
                 namespace = None
 
-            # Get namespace prefix - cached for performance
-            prefix = None
-            for std_prefix, std_uri_base in NAMESPACES.items():
-                if namespace.startswith(std_uri_base):
-                    prefix = std_prefix
-                    break
+            # Get namespace prefix - precompiled matcher, cached per URI
+            prefix = prefix_for_namespace(namespace) if namespace else None
 
             if not prefix and namespace:
                 # Try to extract prefix from the namespace
@@ -212,282 +296,299 @@ class InstanceParser(BaseParser):
         try:
             # Find all context elements
             for context_elem in root.findall('.//{http://www.xbrl.org/2003/instance}context'):
-                context_id = context_elem.get('id')
-                if not context_id:
-                    continue
-
-                # Create context object
-                context = Context(context_id=context_id)
-
-                # Extract entity information
-                entity_elem = context_elem.find('.//{http://www.xbrl.org/2003/instance}entity')
-                if entity_elem is not None:
-                    # Get identifier
-                    identifier_elem = entity_elem.find('.//{http://www.xbrl.org/2003/instance}identifier')
-                    if identifier_elem is not None:
-                        scheme = identifier_elem.get('scheme', '')
-                        identifier = identifier_elem.text
-                        context.entity = {
-                            'scheme': scheme,
-                            'identifier': identifier
-                        }
-
-                    # Get segment dimensions if present
-                    segment_elem = entity_elem.find('.//{http://www.xbrl.org/2003/instance}segment')
-                    if segment_elem is not None:
-                        # Extract explicit dimensions
-                        for dim_elem in segment_elem.findall('.//{http://xbrl.org/2006/xbrldi}explicitMember'):
-                            dimension = dim_elem.get('dimension')
-                            value = dim_elem.text
-                            if dimension and value:
-                                context.dimensions[dimension] = value
-
-                        # Extract typed dimensions
-                        for dim_elem in segment_elem.findall('.//{http://xbrl.org/2006/xbrldi}typedMember'):
-                            dimension = dim_elem.get('dimension')
-                            if dimension:
-                                # The typed dimension value is the text content of the first child element
-                                for child in dim_elem:
-                                    # Extract the text content, which contains the actual typed member value
-                                    if child.text and child.text.strip():
-                                        context.dimensions[dimension] = child.text.strip()
-                                    else:
-                                        # Fallback to tag if no text content
-                                        context.dimensions[dimension] = child.tag
-                                    break
-
-                # Extract period information
-                period_elem = context_elem.find('.//{http://www.xbrl.org/2003/instance}period')
-                if period_elem is not None:
-                    # Check for instant period
-                    instant_elem = period_elem.find('.//{http://www.xbrl.org/2003/instance}instant')
-                    if instant_elem is not None and instant_elem.text:
-                        context.period = {
-                            'type': 'instant',
-                            'instant': instant_elem.text
-                        }
-
-                    # Check for duration period
-                    start_elem = period_elem.find('.//{http://www.xbrl.org/2003/instance}startDate')
-                    end_elem = period_elem.find('.//{http://www.xbrl.org/2003/instance}endDate')
-                    if start_elem is not None and end_elem is not None and start_elem.text and end_elem.text:
-                        context.period = {
-                            'type': 'duration',
-                            'startDate': start_elem.text,
-                            'endDate': end_elem.text
-                        }
-
-                    # Check for forever period
-                    forever_elem = period_elem.find('.//{http://www.xbrl.org/2003/instance}forever')
-                    if forever_elem is not None:
-                        context.period = {
-                            'type': 'forever'
-                        }
-
-                # Add context to registry
-                self.contexts[context_id] = context
+                self._parse_context_element(context_elem)
 
         except Exception as e:
             raise XBRLProcessingError(f"Error extracting contexts: {str(e)}") from e
 
+    def _parse_context_element(self, context_elem: ET.Element) -> None:
+        """Parse a single context element into the contexts registry."""
+        context_id = context_elem.get('id')
+        if not context_id:
+            return
+
+        # Create context object
+        context = Context(context_id=context_id)
+
+        # Extract entity information
+        entity_elem = context_elem.find('.//{http://www.xbrl.org/2003/instance}entity')
+        if entity_elem is not None:
+            # Get identifier
+            identifier_elem = entity_elem.find('.//{http://www.xbrl.org/2003/instance}identifier')
+            if identifier_elem is not None:
+                scheme = identifier_elem.get('scheme', '')
+                identifier = identifier_elem.text
+                context.entity = {
+                    'scheme': scheme,
+                    'identifier': identifier
+                }
+
+            # Get segment dimensions if present
+            segment_elem = entity_elem.find('.//{http://www.xbrl.org/2003/instance}segment')
+            if segment_elem is not None:
+                # Extract explicit dimensions
+                for dim_elem in segment_elem.findall('.//{http://xbrl.org/2006/xbrldi}explicitMember'):
+                    dimension = dim_elem.get('dimension')
+                    value = dim_elem.text
+                    if dimension and value:
+                        context.dimensions[dimension] = value
+
+                # Extract typed dimensions
+                for dim_elem in segment_elem.findall('.//{http://xbrl.org/2006/xbrldi}typedMember'):
+                    dimension = dim_elem.get('dimension')
+                    if dimension:
+                        # The typed dimension value is the text content of the first child element
+                        for child in dim_elem:
+                            # Extract the text content, which contains the actual typed member value
+                            if child.text and child.text.strip():
+                                context.dimensions[dimension] = child.text.strip()
+                            else:
+                                # Fallback to tag if no text content
+                                context.dimensions[dimension] = child.tag
+                            break
+
+        # Extract period information
+        period_elem = context_elem.find('.//{http://www.xbrl.org/2003/instance}period')
+        if period_elem is not None:
+            # Check for instant period
+            instant_elem = period_elem.find('.//{http://www.xbrl.org/2003/instance}instant')
+            if instant_elem is not None and instant_elem.text:
+                context.period = {
+                    'type': 'instant',
+                    'instant': instant_elem.text
+                }
+
+            # Check for duration period
+            start_elem = period_elem.find('.//{http://www.xbrl.org/2003/instance}startDate')
+            end_elem = period_elem.find('.//{http://www.xbrl.org/2003/instance}endDate')
+            if start_elem is not None and end_elem is not None and start_elem.text and end_elem.text:
+                context.period = {
+                    'type': 'duration',
+                    'startDate': start_elem.text,
+                    'endDate': end_elem.text
+                }
+
+            # Check for forever period
+            forever_elem = period_elem.find('.//{http://www.xbrl.org/2003/instance}forever')
+            if forever_elem is not None:
+                context.period = {
+                    'type': 'forever'
+                }
+
+        # Add context to registry
+        self.contexts[context_id] = context
+
+
     def _extract_units(self, root: ET.Element) -> None:
         """Extract units from instance document."""
         try:
             # Find all unit elements
             for unit_elem in root.findall('.//{http://www.xbrl.org/2003/instance}unit'):
-                unit_id = unit_elem.get('id')
-                if not unit_id:
-                    continue
-
-                # Check for measure
-                measure_elem = unit_elem.find('.//{http://www.xbrl.org/2003/instance}measure')
-                if measure_elem is not None and measure_elem.text:
-                    self.units[unit_id] = {
-                        'type': 'simple',
-                        'measure': measure_elem.text
-                    }
-                    continue
+                self._parse_unit_element(unit_elem)
 
-                # Check for divide
-                divide_elem = unit_elem.find('.//{http://www.xbrl.org/2003/instance}divide')
-                if divide_elem is not None:
-                    # Get numerator
-                    numerator_elem = divide_elem.find('.//{http://www.xbrl.org/2003/instance}unitNumerator')
-                    denominator_elem = divide_elem.find('.//{http://www.xbrl.org/2003/instance}unitDenominator')
+        except Exception as e:
+            raise XBRLProcessingError(f"Error extracting units: {str(e)}") from e
 
-                    if numerator_elem is not None and denominator_elem is not None:
-                        # Get measures
-                        numerator_measures = [elem.text for elem in numerator_elem.findall('.//{http://www.xbrl.org/2003/instance}measure') if elem.text]
-                        denominator_measures = [elem.text for elem in denominator_elem.findall('.//{http://www.xbrl.org/2003/instance}measure') if elem.text]
+    def _parse_unit_element(self, unit_elem: ET.Element) -> None:
+        """Parse a single unit element into the units registry."""
+        unit_id = unit_elem.get('id')
+        if not unit_id:
+            return
+
+        # Check for measure
+        measure_elem = unit_elem.find('.//{http://www.xbrl.org/2003/instance}measure')
+        if measure_elem is not None and measure_elem.text:
+            self.units[unit_id] = {
+                'type': 'simple',
+                'measure': measure_elem.text
+            }
+            return
+
+        # Check for divide
+        divide_elem = unit_elem.find('.//{http://www.xbrl.org/2003/instance}divide')
+        if divide_elem is not None:
+            # Get numerator
+            numerator_elem = divide_elem.find('.//{http://www.xbrl.org/2003/instance}unitNumerator')
+            denominator_elem = divide_elem.find('.//{http://www.xbrl.org/2003/instance}unitDenominator')
+
+            if numerator_elem is not None and denominator_elem is not None:
+                # Get measures
+                numerator_measures = [elem.text for elem in numerator_elem.findall('.//{http://www.xbrl.org/2003/instance}measure') if elem.text]
+                denominator_measures = [elem.text for elem in denominator_elem.findall('.//{http://www.xbrl.org/2003/instance}measure') if elem.text]
+
+                self.units[unit_id] = {
+                    'type': 'divide',
+                    'numerator': numerator_measures,
+                    'denominator': denominator_measures
+                }
+
+    @staticmethod
+    def _build_prefix_map(root: ET.Element) -> Dict[str, str]:
+        """Build a namespace-uri -> prefix map from the document root."""
+        # Get direct access to nsmap if using lxml (much faster than regex extraction)
+        if hasattr(root, 'nsmap'):
+            # Leverage lxml's native nsmap functionality
+            return {uri: prefix for prefix, uri in root.nsmap.items() if prefix is not None}
+
+        # Fallback for ElementTree - extract namespace declarations from root
+        xmlns_pattern = '{http://www.w3.org/2000/xmlns/}'
+        prefix_map = {}
+        for attr_name, attr_value in root.attrib.items():
+            if attr_name.startswith(xmlns_pattern) or attr_name.startswith('xmlns:'):
+                # Extract the prefix more efficiently
+                if attr_name.startswith(xmlns_pattern):
+                    prefix = attr_name[len(xmlns_pattern):]
+                else:
+                    prefix = attr_name.split(':', 1)[1]
+                prefix_map[attr_value] = prefix
+        return prefix_map
+
+    # Fast path to identify non-fact elements to skip - set for O(1) membership
+    _SKIP_FACT_TAG_ENDINGS = frozenset({
+        'schemaRef',
+        'roleRef',
+        'arcroleRef',
+        'linkbaseRef',
+        'context',
+        'unit'
+    })
+
+    def _process_fact_element(self, element, prefix_map: Dict[str, str],
+                              facts_dict: Dict[str, Fact], base_keys: Dict[str, list]) -> int:
+        """
+        Process a single element as a potential fact.
 
-                        self.units[unit_id] = {
-                            'type': 'divide',
-                            'numerator': numerator_measures,
-                            'denominator': denominator_measures
-                        }
+        Returns the number of facts stored (0 or 1) so callers can keep a
+        running count.
+        """
+        # Skip annotation nodes and other non element nodes
+        if not ET.iselement(element):
+            return 0
+        # Skip known non-fact elements - faster check with set membership
+        # If the tag is not a string, try calling () to get the string value (in rare cases)
+        if callable(element.tag):
+            if isinstance(element, ET._Comment):
+                return 0
+            if not element.values():
+                return 0
+        tag = element.tag
+        for ending in self._SKIP_FACT_TAG_ENDINGS:
+            if tag.endswith(ending):
+                return 0
+
+        # Get context reference - key check to identify facts
+        context_ref = element.get('contextRef')
+        if not context_ref:
+            return 0
+
+        # Get fact ID if present (for footnote linkage)
+        fact_id = element.get('id')
+
+        # Extract element namespace and name - optimized split
+        if '}' in tag:
+            namespace, element_name = tag.split('}', 1)
+            namespace = namespace[1:]  # Faster than strip('{')
+
+            # Try to extract prefix from the namespace
+            prefix = prefix_map.get(namespace)
+            if not prefix:
+                parts = namespace.split('/')
+                prefix = parts[-1] if parts else ''
+        else:
+            element_name = tag
+            prefix = ''
+
+        # Construct element ID with optimized string concatenation
+        element_id = f"{prefix}:{element_name}" if prefix else element_name
+
+        # Get unit reference
+        unit_ref = element.get('unitRef')
+
+        # Get value - optimize string handling
+        value = element.text
+        if not value or not value.strip():
+            # Only check children if text is empty - use direct iteration for speed
+            for sub_elem in element:
+                sub_text = sub_elem.text
+                if sub_text and sub_text.strip():
+                    value = sub_text
+                    break
 
-        except Exception as e:
-            raise XBRLProcessingError(f"Error extracting units: {str(e)}") from e
+        # Optimize string handling - inline conditional
+        value = value.strip() if value else ""
+
+        # Get decimals attribute - direct access
+        decimals = element.get('decimals')
+
+        # Optimize numeric conversion with faster try/except
+        numeric_value = None
+        if value:
+            try:
+                numeric_value = float(value)
+            except (ValueError, TypeError):
+                pass
+
+        # Create base key for duplicate detection
+        base_key = self._create_normalized_fact_key(element_id, context_ref)
+
+        # Handle duplicates
+        instance_id = None
+        if base_key in base_keys:
+            # This is a duplicate - convert existing fact to use instance_id if needed
+            if base_key in facts_dict:
+                existing_fact = facts_dict[base_key]
+                # Move existing fact to new key with instance_id=0
+                del facts_dict[base_key]
+                existing_fact.instance_id = 0
+                facts_dict[self._create_normalized_fact_key(element_id, context_ref, 0)] = existing_fact
+            # Add new fact with next instance_id
+            instance_id = len(base_keys[base_key])
+            base_keys[base_key].append(True)
+        else:
+            # First instance of this fact
+            base_keys[base_key] = [True]
+
+        # Create fact object
+        fact = Fact(
+            element_id=element_id,
+            context_ref=context_ref,
+            value=value,
+            unit_ref=unit_ref,
+            decimals=decimals,
+            numeric_value=numeric_value,
+            instance_id=instance_id,
+            fact_id=fact_id
+        )
+
+        # Store fact with appropriate key
+        key = self._create_normalized_fact_key(element_id, context_ref, instance_id)
+        facts_dict[key] = fact
+        return 1
 
     def _extract_facts(self, root: ET.Element) -> None:
         """Extract facts from instance document."""
         try:
-            # Get direct access to nsmap if using lxml (much faster than regex extraction)
-            if hasattr(root, 'nsmap'):
-                # Leverage lxml's native nsmap functionality
-                prefix_map = {uri: prefix for prefix, uri in root.nsmap.items() if prefix is not None}
-            else:
-                # Fallback for ElementTree - precompile regex patterns for namespace extraction
-                xmlns_pattern = '{http://www.w3.org/2000/xmlns/}'
-                prefix_map = {}
-
-                # Extract namespace declarations from root
-                for attr_name, attr_value in root.attrib.items():
-                    if attr_name.startswith(xmlns_pattern) or attr_name.startswith('xmlns:'):
-                        # Extract the prefix more efficiently
-                        if attr_name.startswith(xmlns_pattern):
-                            prefix = attr_name[len(xmlns_pattern):]
-                        else:
-                            prefix = attr_name.split(':', 1)[1]
-                        prefix_map[attr_value] = prefix
+            prefix_map = self._build_prefix_map(root)
 
             # Initialize counters and tracking
             fact_count = 0
             facts_dict = {}
             base_keys = {}
 
-            # Fast path to identify non-fact elements to skip - compile as set for O(1) lookup
-            skip_tag_endings = {
-                'schemaRef',
-                'roleRef',
-                'arcroleRef',
-                'linkbaseRef',
-                'context',
-                'unit'
-            }
-
-            def process_element(element):
-                """Process a single element as a potential fact."""
-                nonlocal fact_count
-
-                # Skip annotation nodes and other non element nodes
-                if not ET.iselement(element):
-                    return
-                # Skip known non-fact elements - faster check with set membership
-                # If the tag is not a string, try calling () to get the string value (in rare cases)
-                if callable(element.tag):
-                    if isinstance(element, ET._Comment):
-                        return
-                    if not element.values():
-                        return
-                tag = element.tag
-                for ending in skip_tag_endings:
-                    if tag.endswith(ending):
-                        return
-
-                # Get context reference - key check to identify facts
-                context_ref = element.get('contextRef')
-                if not context_ref:
-                    return
-
-                # Get fact ID if present (for footnote linkage)
-                fact_id = element.get('id')
-
-                # Extract element namespace and name - optimized split
-                if '}' in tag:
-                    namespace, element_name = tag.split('}', 1)
-                    namespace = namespace[1:]  # Faster than strip('{')
-
-                    # Try to extract prefix from the namespace
-                    prefix = prefix_map.get(namespace)
-                    if not prefix:
-                        parts = namespace.split('/')
-                        prefix = parts[-1] if parts else ''
-                else:
-                    element_name = tag
-                    prefix = ''
-
-                # Construct element ID with optimized string concatenation
-                element_id = f"{prefix}:{element_name}" if prefix else element_name
-
-                # Get unit reference
-                unit_ref = element.get('unitRef')
-
-                # Get value - optimize string handling
-                value = element.text
-                if not value or not value.strip():
-                    # Only check children if text is empty - use direct iteration for speed
-                    for sub_elem in element:
-                        sub_text = sub_elem.text
-                        if sub_text and sub_text.strip():
-                            value = sub_text
-                            break
-
-                # Optimize string handling - inline conditional
-                value = value.strip() if value else ""
-
-                # Get decimals attribute - direct access
-                decimals = element.get('decimals')
-
-                # Optimize numeric conversion with faster try/except
-                numeric_value = None
-                if value:
-                    try:
-                        numeric_value = float(value)
-                    except (ValueError, TypeError):
-                        pass
-
-                # Create base key for duplicate detection
-                base_key = self._create_normalized_fact_key(element_id, context_ref)
-
-                # Handle duplicates
-                instance_id = None
-                if base_key in base_keys:
-                    # This is a duplicate - convert existing fact to use instance_id if needed
-                    if base_key in facts_dict:
-                        existing_fact = facts_dict[base_key]
-                        # Move existing fact to new key with instance_id=0
-                        del facts_dict[base_key]
-                        existing_fact.instance_id = 0
-                        facts_dict[self._create_normalized_fact_key(element_id, context_ref, 0)] = existing_fact
-                    # Add new fact with next instance_id
-                    instance_id = len(base_keys[base_key])
-                    base_keys[base_key].append(True)
-                else:
-                    # First instance of this fact
-                    base_keys[base_key] = [True]
-
-                # Create fact object
-                fact = Fact(
-                    element_id=element_id,
-                    context_ref=context_ref,
-                    value=value,
-                    unit_ref=unit_ref,
-                    decimals=decimals,
-                    numeric_value=numeric_value,
-                    instance_id=instance_id,
-                    fact_id=fact_id
-                )
-
-                # Store fact with appropriate key
-                key = self._create_normalized_fact_key(element_id, context_ref, instance_id)
-                facts_dict[key] = fact
-                fact_count += 1
-
             # Use lxml's optimized traversal methods
             if hasattr(root, 'iterchildren'):
                 # Use lxml's optimized traversal methods
                 for child in root.iterchildren():
-                    process_element(child)
+                    fact_count += self._process_fact_element(child, prefix_map, facts_dict, base_keys)
                     # Process nested elements with optimized iteration
                     for descendant in child.iterdescendants():
-                        process_element(descendant)
+                        fact_count += self._process_fact_element(descendant, prefix_map, facts_dict, base_keys)
             else:
                 # Fallback for ElementTree
                 for child in root:
-                    process_element(child)
+                    fact_count += self._process_fact_element(child, prefix_map, facts_dict, base_keys)
                     for descendant in child.findall('.//*'):
-                        process_element(descendant)
+                        fact_count += self._process_fact_element(descendant, prefix_map, facts_dict, base_keys)
 
             # Update instance facts
             self.facts.update(facts_dict)
@@ -505,71 +606,12 @@ class InstanceParser(BaseParser):
         2. footnoteArc elements that connect fact IDs to footnote IDs
         """
         try:
-            from edgar.xbrl.models import Footnote
-
             # Track undefined footnotes for deduplication
             undefined_footnotes = set()
 
             # Find all footnoteLink elements
             for footnote_link in root.findall('.//{http://www.xbrl.org/2003/linkbase}footnoteLink'):
-                # First, extract all footnote definitions
-                for footnote_elem in footnote_link.findall('{http://www.xbrl.org/2003/linkbase}footnote'):
-                    # Prioritize xlink:label over id attribute for footnote identification.
-                    # FootnoteArcs reference footnotes using xlink:to, which corresponds to xlink:label.
-                    # In pre-2016 filings, these attributes often differ (e.g., xlink:label="lbl_footnote_0"
-                    # vs id="FN_0"), so we must use xlink:label to match arc references correctly.
-                    footnote_id = footnote_elem.get('{http://www.w3.org/1999/xlink}label') or footnote_elem.get('id')
-                    if not footnote_id:
-                        continue
-
-                    # Get footnote attributes
-                    lang = footnote_elem.get('{http://www.w3.org/XML/1998/namespace}lang', 'en-US')
-                    role = footnote_elem.get('{http://www.w3.org/1999/xlink}role')
-
-                    # Extract text content, handling XHTML formatting
-                    footnote_text = ""
-                    # Check for XHTML content
-                    xhtml_divs = footnote_elem.findall('.//{http://www.w3.org/1999/xhtml}div')
-                    if xhtml_divs:
-                        # Concatenate all text within XHTML elements
-                        for div in xhtml_divs:
-                            footnote_text += "".join(div.itertext()).strip()
-                    else:
-                        # Fall back to direct text content
-                        footnote_text = "".join(footnote_elem.itertext()).strip()
-
-                    # Create Footnote object
-                    footnote = Footnote(
-                        footnote_id=footnote_id,
-                        text=footnote_text,
-                        lang=lang,
-                        role=role,
-                        related_fact_ids=[]
-                    )
-                    self.footnotes[footnote_id] = footnote
-
-                # Second, process footnoteArc elements to link facts to footnotes
-                for arc_elem in footnote_link.findall('{http://www.xbrl.org/2003/linkbase}footnoteArc'):
-                    fact_id = arc_elem.get('{http://www.w3.org/1999/xlink}from')
-                    footnote_id = arc_elem.get('{http://www.w3.org/1999/xlink}to')
-
-                    if fact_id and footnote_id:
-                        # Add fact ID to footnote's related facts
-                        if footnote_id in self.footnotes:
-                            self.footnotes[footnote_id].related_fact_ids.append(fact_id)
-                        else:
-                            # Track undefined footnote (common in older filings due to naming inconsistencies)
-                            if footnote_id not in undefined_footnotes:
-                                undefined_footnotes.add(footnote_id)
-                                log.debug(f"Footnote arc references undefined footnote: {footnote_id}")
-
-                        # Also update the fact's footnotes list if we can find it
-                        # This requires finding the fact by its fact_id
-                        for fact in self.facts.values():
-                            if fact.fact_id == fact_id:
-                                if footnote_id not in fact.footnotes:
-                                    fact.footnotes.append(footnote_id)
-                                break
+                self._parse_footnote_link(footnote_link, undefined_footnotes)
 
             # Summary message for undefined footnotes (non-critical)
             if undefined_footnotes:
@@ -581,6 +623,84 @@ class InstanceParser(BaseParser):
             # Log the error but don't fail - footnotes are optional
             log.warning(f"Error extracting footnotes: {str(e)}")
 
+    def _parse_footnote_link(self, footnote_link: ET.Element,
+                             undefined_footnotes: set,
+                             facts: Dict[str, Fact] = None) -> None:
+        """
+        Parse a single footnoteLink element: footnote definitions plus the
+        arcs connecting fact IDs to footnote IDs.
+
+        Args:
+            footnote_link: The footnoteLink element
+            undefined_footnotes: Set tracking unresolved footnote references
+            facts: Facts to attach footnote IDs to; defaults to the parser's
+                fact registry (the streaming path passes its in-progress dict)
+        """
+        from edgar.xbrl.models import Footnote
+
+        if facts is None:
+            facts = self.facts
+
+        # First, extract all footnote definitions
+        for footnote_elem in footnote_link.findall('{http://www.xbrl.org/2003/linkbase}footnote'):
+            # Prioritize xlink:label over id attribute for footnote identification.
+            # FootnoteArcs reference footnotes using xlink:to, which corresponds to xlink:label.
+            # In pre-2016 filings, these attributes often differ (e.g., xlink:label="lbl_footnote_0"
+            # vs id="FN_0"), so we must use xlink:label to match arc references correctly.
+            footnote_id = footnote_elem.get('{http://www.w3.org/1999/xlink}label') or footnote_elem.get('id')
+            if not footnote_id:
+                continue
+
+            # Get footnote attributes
+            lang = footnote_elem.get('{http://www.w3.org/XML/1998/namespace}lang', 'en-US')
+            role = footnote_elem.get('{http://www.w3.org/1999/xlink}role')
+
+            # Extract text content, handling XHTML formatting
+            footnote_text = ""
+            # Check for XHTML content
+            xhtml_divs = footnote_elem.findall('.//{http://www.w3.org/1999/xhtml}div')
+            if xhtml_divs:
+                # Concatenate all text within XHTML elements
+                for div in xhtml_divs:
+                    footnote_text += "".join(div.itertext()).strip()
+            else:
+                # Fall back to direct text content
+                footnote_text = "".join(footnote_elem.itertext()).strip()
+
+            # Create Footnote object
+            footnote = Footnote(
+                footnote_id=footnote_id,
+                text=footnote_text,
+                lang=lang,
+                role=role,
+                related_fact_ids=[]
+            )
+            self.footnotes[footnote_id] = footnote
+
+        # Second, process footnoteArc elements to link facts to footnotes
+        for arc_elem in footnote_link.findall('{http://www.xbrl.org/2003/linkbase}footnoteArc'):
+            fact_id = arc_elem.get('{http://www.w3.org/1999/xlink}from')
+            footnote_id = arc_elem.get('{http://www.w3.org/1999/xlink}to')
+
+            if fact_id and footnote_id:
+                # Add fact ID to footnote's related facts
+                if footnote_id in self.footnotes:
+                    self.footnotes[footnote_id].related_fact_ids.append(fact_id)
+                else:
+                    # Track undefined footnote (common in older filings due to naming inconsistencies)
+                    if footnote_id not in undefined_footnotes:
+                        undefined_footnotes.add(footnote_id)
+                        log.debug(f"Footnote arc references undefined footnote: {footnote_id}")
+
+                # Also update the fact's footnotes list if we can find it
+                # This requires finding the fact by its fact_id
+                for fact in facts.values():
+                    if fact.fact_id == fact_id:
+                        if footnote_id not in fact.footnotes:
+                            fact.footnotes.append(footnote_id)
+                        break
+
+
     def _extract_entity_info(self) -> None:
         """Extract entity information from contexts and DEI facts."""
         try:
@@ -50,7 +50,7 @@ class LabelsParser(BaseParser):
             }
 
             # Optimize: Use lxml parser with smart string handling
-            parser = ET.XMLParser(remove_blank_text=True, recover=True)
+            parser = ET.XMLParser(remove_blank_text=True, recover=True, collect_ids=False)
             root = ET.XML(content.encode('utf-8'), parser)
 
             # Optimize: Use specific XPath expressions with namespaces for faster lookups
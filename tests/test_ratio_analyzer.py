@@ -0,0 +1,165 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from edgar.xbrl.analysis._ratio_kernels import safe_ratio, safe_ratio_panel
+from edgar.xbrl.analysis.analyzer import FinancialRatioAnalyzer, RatioResult
+
+PERIODS = ["2023-12-31", "2022-12-31", "2021-12-31"]
+
+
+@pytest.fixture
+def analyzer():
+    balance_sheet = pd.DataFrame({
+        "period": PERIODS,
+        "current_assets": [100.0, 90.0, 80.0],
+        "current_liabilities": [50.0, 45.0, 0.0],
+        "total_assets": [500.0, 450.0, 400.0],
+    })
+    income_stmt = pd.DataFrame({
+        "period": PERIODS,
+        "net_income": [50.0, 40.0, 30.0],
+    })
+    return FinancialRatioAnalyzer(balance_sheet, income_stmt, periods=PERIODS)
+
+
+@pytest.mark.fast
+def test_current_ratio(analyzer):
+    results = analyzer.calculate_current_ratio()
+    assert [r.period for r in results] == PERIODS
+    assert results[0] == RatioResult("Current Ratio", "2023-12-31", 2.0)
+    assert results[1].result == 2.0
+
+
+@pytest.mark.fast
+def test_current_ratio_zero_liabilities_is_infinite(analyzer):
+    results = analyzer.calculate_current_ratio()
+    assert math.isinf(results[2].result)
+
+
+@pytest.mark.fast
+def test_return_on_assets(analyzer):
+    results = analyzer.calculate_return_on_assets()
+    assert len(results) == 3
+    assert results[0].result == pytest.approx(0.1)
+    assert results[2].result == pytest.approx(0.075)
+
+
+@pytest.mark.fast
+def test_periods_missing_from_statements_are_skipped():
+    balance_sheet = pd.DataFrame({
+        "period": ["2023-12-31"],
+        "current_assets": [100.0],
+        "current_liabilities": [50.0],
+        "total_assets": [500.0],
+    })
+    income_stmt = pd.DataFrame({
+        "period": ["2023-12-31"],
+        "net_income": [50.0],
+    })
+    analyzer = FinancialRatioAnalyzer(balance_sheet, income_stmt,
+                                      periods=["2023-12-31", "2019-12-31"])
+    assert analyzer.periods == ["2023-12-31"]
+    assert len(analyzer.calculate_current_ratio()) == 1
+
+
+@pytest.mark.fast
+def test_current_ratio_frame(analyzer):
+    frame = analyzer.calculate_current_ratio_frame()
+    assert list(frame.columns) == ["name", "period", "result"]
+    assert frame["name"].eq("Current Ratio").all()
+    assert frame["period"].tolist() == PERIODS
+    assert frame["result"].iloc[0] == 2.0
+    assert np.isinf(frame["result"].iloc[2])
+
+
+@pytest.mark.fast
+def test_frames_stack_with_concat(analyzer):
+    stacked = pd.concat([analyzer.calculate_current_ratio_frame(),
+                         analyzer.calculate_return_on_assets_frame()],
+                        ignore_index=True)
+    assert len(stacked) == 6
+    assert set(stacked["name"]) == {"Current Ratio", "Return on Assets"}
+
+
+@pytest.mark.fast
+def test_legacy_results_match_frame(analyzer):
+    frame = analyzer.calculate_return_on_assets_frame()
+    results = analyzer.calculate_return_on_assets()
+    assert [r.period for r in results] == frame["period"].tolist()
+    assert [r.result for r in results] == frame["result"].tolist()
+
+
+@pytest.mark.fast
+def test_safe_ratio_kernel_semantics():
+    num = np.array([10.0, 5.0, np.nan, 0.0])
+    den = np.array([5.0, 0.0, 2.0, 4.0])
+    out = safe_ratio(num, den)
+    assert out[0] == 2.0
+    assert math.isinf(out[1])
+    assert math.isnan(out[2])  # missing data propagates
+    assert out[3] == 0.0
+
+
+@pytest.mark.fast
+def test_safe_ratio_panel_kernel():
+    num = np.array([[10.0, 4.0], [np.nan, 9.0]])
+    den = np.array([[5.0, 0.0], [3.0, 3.0]])
+    out = safe_ratio_panel(num, den)
+    assert out[0, 0] == 2.0
+    assert math.isinf(out[0, 1])
+    assert math.isnan(out[1, 0])
+    assert out[1, 1] == 3.0
+
+
+@pytest.mark.fast
+def test_nullable_and_object_dtypes_are_coerced():
+    balance_sheet = pd.DataFrame({
+        "period": PERIODS,
+        "current_assets": pd.array([100.0, 90.0, None], dtype="Float64"),
+        "current_liabilities": ["50", "45", ""],
+        "total_assets": [500, 450, 400],
+    })
+    income_stmt = pd.DataFrame({
+        "period": PERIODS,
+        "net_income": [50.0, 40.0, 30.0],
+    })
+    analyzer = FinancialRatioAnalyzer(balance_sheet, income_stmt, periods=PERIODS)
+    results = analyzer.calculate_current_ratio()
+    assert [r.period for r in results] == PERIODS[:2]
+    assert results[0].result == 2.0
+    roa = analyzer.calculate_return_on_assets()
+    assert roa[0].result == pytest.approx(0.1)
+
+
+@pytest.mark.fast
+def test_input_frames_are_not_mutated():
+    balance_sheet = pd.DataFrame({
+        "period": PERIODS,
+        "current_assets": [100.0, 90.0, 80.0],
+        "current_liabilities": [50.0, 45.0, 40.0],
+        "total_assets": [500.0, 450.0, 400.0],
+        "goodwill": [10.0, 10.0, 10.0],
+    })
+    income_stmt = pd.DataFrame({"net_income": [50.0, 40.0, 30.0]}, index=[2023, 2022, 2021])
+    FinancialRatioAnalyzer(balance_sheet, income_stmt, periods=PERIODS)
+    # 'period' stays a column on the caller's frame and the int index survives
+    assert "period" in balance_sheet.columns
+    assert income_stmt.index.tolist() == [2023, 2022, 2021]
+
+
+@pytest.mark.fast
+def test_missing_column_yields_no_results(analyzer):
+    balance_sheet = pd.DataFrame({
+        "period": PERIODS,
+        "total_assets": [500.0, 450.0, 400.0],
+    })
+    income_stmt = pd.DataFrame({
+        "period": PERIODS,
+        "net_income": [50.0, 40.0, 30.0],
+    })
+    analyzer = FinancialRatioAnalyzer(balance_sheet, income_stmt, periods=PERIODS)
+    assert analyzer.calculate_current_ratio() == []
+    assert len(analyzer.calculate_return_on_assets()) == 3